@@ -48,6 +48,8 @@ export default function AlertsPage() {
         );
     }
 
+    const severityCounts = countBySeverity(alerts);
+
     return (
         <DashboardLayout>
             <div className="space-y-6">
@@ -68,17 +70,17 @@ export default function AlertsPage() {
                     />
                     <StatCard
                         title="Critical"
-                        value={alerts.filter(a => a.severity === 'critical').length}
+                        value={severityCounts.critical}
                         color="text-red-400"
                     />
                     <StatCard
                         title="Warning"
-                        value={alerts.filter(a => a.severity === 'warning').length}
+                        value={severityCounts.warning}
                         color="text-yellow-400"
                     />
                     <StatCard
                         title="Info"
-                        value={alerts.filter(a => a.severity === 'info').length}
+                        value={severityCounts.info}
                         color="text-blue-400"
                     />
                 </div>
@@ -129,7 +131,7 @@ function AlertCard({ alert, onResolve, isResolving }: {
 }) {
     const config = severityConfig[alert.severity];
     const Icon = config.icon;
-    const timeAgo = getTimeAgo(new Date(alert.timestamp));
+    const timeAgo = getTimeAgo(alert.timestamp);
 
     return (
         <div className={`p-6 flex items-start gap-4 ${config.bg}`}>
@@ -167,11 +169,19 @@ function AlertCard({ alert, onResolve, isResolving }: {
     );
 }
 
-function getTimeAgo(date: Date): string {
-    const seconds = Math.floor((new Date().getTime() - date.getTime()) / 1000);
+function getTimeAgo(timestamp: string): string {
+    const seconds = Math.floor((Date.now() - Date.parse(timestamp)) / 1000);
 
     if (seconds < 60) return 'Just now';
     if (seconds < 3600) return `${Math.floor(seconds / 60)}m ago`;
     if (seconds < 86400) return `${Math.floor(seconds / 3600)}h ago`;
     return `${Math.floor(seconds / 86400)}d ago`;
 }
+
+function countBySeverity(alerts: Alert[]): Record<Alert['severity'], number> {
+    const counts = { critical: 0, error: 0, warning: 0, info: 0 };
+    for (const alert of alerts) {
+        counts[alert.severity]++;
+    }
+    return counts;
+}